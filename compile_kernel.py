@@ -0,0 +1,27 @@
+"""
+Ahead-of-time compiles the default listener kernel from demo.py into the _sift_kernel extension module.
+
+Run `python compile_kernel.py` once per platform (numba is needed only for this step). demo.py imports
+the resulting module when it is present and its kernel_version() matches demo.KERNEL_VERSION, so
+short-lived scripts skip both importing numba and its JIT warm-up; otherwise it imports numba and
+falls back to JIT compilation, or to plain Python without numba.
+"""
+import os
+
+from numba.pycc import CC
+
+from demo import KERNEL_VERSION, _sim_kernel
+
+cc = CC("_sift_kernel")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# signal_idx, listener_memory, action_draws -> action_idx
+cc.export("sim_kernel", "i4[:](i4[:], i4[:], i4[:])")(_sim_kernel)
+
+
+@cc.export("kernel_version", "i8()")
+def kernel_version():
+    return KERNEL_VERSION
+
+if __name__ == "__main__":
+    cc.compile()
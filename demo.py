@@ -1,23 +1,269 @@
+import json
 import random
+import warnings
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from operator import itemgetter
 
-def create_sift_simulation(num_rounds, state_space, action_space, speaker_strategy=None, listener_strategy=None):
+import numpy as np
+
+# Rounds simulated per chunk when create_sift_simulation streams to a sink.
+STREAM_CHUNK_ROUNDS = 65536
+
+@dataclass(eq=False)
+class SiftHistory:
+    """
+    Struct-of-arrays record of a SIFT simulation.
+
+    Each round is stored as integer indices into the string tables rather than as a dictionary,
+    so analysis can scan contiguous arrays. Indexing or iterating a SiftHistory still yields the
+    per-round dictionaries (round, state, signal, action, is_correct) for display code; slicing
+    returns a list of those dictionaries, as slicing the old list-of-dicts history did.
+
+    Attributes:
+        state_idx: Per-round index into state_space.
+        signal_idx: Per-round index into signals.
+        action_idx: Per-round index into action_space.
+        is_correct: Per-round boolean array, True if the action was correct.
+        state_space: The list of possible states.
+        signals: The signal table, including any signals produced by a custom speaker.
+        action_space: The action table, including any out-of-space actions from a custom listener.
+    """
+    state_idx: np.ndarray
+    signal_idx: np.ndarray
+    action_idx: np.ndarray
+    is_correct: np.ndarray
+    state_space: list
+    signals: list
+    action_space: list
+
+    def __len__(self):
+        return len(self.state_idx)
+
+    def __getitem__(self, round_index):
+        if isinstance(round_index, slice):
+            return [self[i] for i in range(len(self))[round_index]]
+        round_index = range(len(self))[round_index]
+        return {
+            "round": round_index + 1,
+            "state": self.state_space[self.state_idx[round_index]],
+            "signal": self.signals[self.signal_idx[round_index]],
+            "action": self.action_space[self.action_idx[round_index]],
+            "is_correct": bool(self.is_correct[round_index]),
+        }
+
+    def __iter__(self):
+        rounds = zip(
+            self.state_idx.tolist(), self.signal_idx.tolist(), self.action_idx.tolist(), self.is_correct.tolist()
+        )
+        for round_index, (state, signal, action, is_correct) in enumerate(rounds):
+            yield {
+                "round": round_index + 1,
+                "state": self.state_space[state],
+                "signal": self.signals[signal],
+                "action": self.action_space[action],
+                "is_correct": is_correct,
+            }
+
+@dataclass(eq=False)
+class LabeledFlags(Mapping):
+    """
+    Boolean flags stored as a NumPy array aligned with a list of labels.
+
+    Used for the signal consistency (per state) and signal ambiguity (per signal) results of
+    analyze_results. It is a read-only mapping from label to flag and prints like a dictionary;
+    as_dict() returns a plain dictionary. Bulk access (items(), values(), ==) zips the arrays
+    directly, and the label index used by single lookups is built on first use.
+
+    Attributes:
+        labels: The list of labels (states or signals).
+        flags: Boolean array with one flag per label.
+    """
+    labels: list
+    flags: np.ndarray
+    _index: dict = field(default=None, init=False, repr=False)
+
+    def as_dict(self):
+        return dict(zip(self.labels, self.flags.tolist()))
+
+    def items(self):
+        return self.as_dict().items()
+
+    def values(self):
+        return self.flags.tolist()
+
+    def __eq__(self, other):
+        if isinstance(other, LabeledFlags):
+            return self.as_dict() == other.as_dict()
+        if isinstance(other, Mapping):
+            return self.as_dict() == dict(other)
+        return NotImplemented
+
+    def __getitem__(self, label):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return bool(self.flags[self._index[label]])
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def __repr__(self):
+        return repr(self.as_dict())
+
+def _intern(value, table, index):
+    """Returns the position of value in table, appending it first if it has not been seen."""
+    position = index.get(value)
+    if position is None:
+        position = index[value] = len(table)
+        table.append(value)
+    return position
+
+def _fast_default_simulation(num_rounds, state_space, action_space, first_action, rng):
+    """
+    Closed-form equivalent of running the default speaker and listener strategies.
+
+    The default speaker always sends signal i for state i, and the default listener picks a
+    random action the first time it sees a signal and repeats it afterwards. Drawing one action
+    per signal up front and indexing it with the sampled states gives the same outcome without
+    a per-round Python loop, or any of the mappings and strategies the general path builds.
+
+    Args:
+        num_rounds: The number of communication rounds to simulate.
+        state_space: A list of possible states (one signal is generated per state).
+        action_space: A list of possible actions.
+        first_action: The listener's action index for each signal, drawn once per simulation.
+        rng: The np.random.Generator to draw states from.
+
+    Returns:
+        A SiftHistory for the simulated rounds.
+    """
+    num_states = len(state_space)
+    signals = [f"signal_{i}" for i in range(num_states)]
+    state_idx = rng.integers(0, num_states, size=num_rounds, dtype=np.int32)
+    action_idx = first_action[state_idx]
+    # Signal i is correct for action i; signals without a matching action are never correct.
+    is_correct = action_idx == state_idx
+    return SiftHistory(state_idx, state_idx, action_idx, is_correct, list(state_space), signals, list(action_space))
+
+# Version of _sim_kernel's interface. compile_kernel.py bakes it into the ahead-of-time build, and
+# a build reporting a different version is ignored. Bump it whenever _sim_kernel's signature or
+# semantics change.
+#   1: (signal_idx, num_signals, action_draws), memory allocated inside the kernel
+#   2: (signal_idx, listener_memory, action_draws), caller-owned memory updated in place
+KERNEL_VERSION = 2
+
+def _sim_kernel(signal_idx, listener_memory, action_draws):
+    """
+    Runs the default listener strategy over a sequence of signal indices.
+
+    The listener repeats the action it previously took for a signal, and otherwise takes the
+    pre-drawn action for that round. Its memory is an array indexed by signal (-1 for unseen
+    signals), so the loop only does integer array operations and compiles in nopython mode when
+    numba is available.
+
+    Args:
+        signal_idx: Per-round signal indices.
+        listener_memory: Action index taken for each signal so far, or -1. Updated in place, so it
+                         carries over when a simulation is run in several chunks.
+        action_draws: Per-round random action indices, used when a signal is seen for the first time.
+
+    Returns:
+        The per-round action indices as a NumPy array.
+    """
+    num_rounds = signal_idx.shape[0]
+    action_idx = np.empty(num_rounds, dtype=np.int32)
+    for i in range(num_rounds):
+        signal = signal_idx[i]
+        if listener_memory[signal] < 0:
+            listener_memory[signal] = action_draws[i]
+        action_idx[i] = listener_memory[signal]
+    return action_idx
+
+def _load_aot_kernel():
+    """
+    Returns the ahead-of-time build of _sim_kernel produced by compile_kernel.py, which avoids the
+    JIT warm-up, or None if it is missing or was built from a different KERNEL_VERSION.
+    """
+    try:
+        import _sift_kernel
+    except ImportError:
+        return None
+    kernel_version = getattr(_sift_kernel, "kernel_version", None)
+    if kernel_version is None or kernel_version() != KERNEL_VERSION:
+        warnings.warn(
+            "Ignoring stale _sift_kernel build; re-run compile_kernel.py to rebuild it.", RuntimeWarning
+        )
+        return None
+    return _sift_kernel.sim_kernel
+
+_run_sim_kernel = _load_aot_kernel()
+if _run_sim_kernel is None:
+    # numba is only imported here, so a current ahead-of-time build also skips its import cost.
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; without it _sim_kernel runs as plain Python.
+        _run_sim_kernel = _sim_kernel
+    else:
+        _run_sim_kernel = njit(cache=True)(_sim_kernel)
+
+def create_sift_simulation(
+    num_rounds, state_space, action_space, speaker_strategy=None, listener_strategy=None, seed=None, sink=None
+):
     """
     Simulates the Simple Instruction Following Test (SIFT) between two AI agents.
 
+    When both strategies are None the simulation runs as a vectorized NumPy fast path. Otherwise a
+    default or dict listener runs as _sim_kernel over integer signal indices (ahead-of-time compiled
+    by compile_kernel.py, else JIT-compiled when numba is installed), and only a function listener
+    runs in the Python loop.
+
     Args:
         num_rounds: The number of communication rounds to simulate.
         state_space: A list of possible states (e.g., ["Red Circle", "Blue Square", "Green Triangle", "Yellow Star"]).
         action_space: A list of possible actions (e.g., ["Pick Top-Left", "Pick Top-Right", "Pick Bottom-Left", "Pick Bottom-Right"]).
-        speaker_strategy: A function that takes the current state and round number, and returns a signal (string).
-                        If None, uses a random signal from a predefined set.
+        speaker_strategy: A function that takes the current state and round number, and returns a signal (string),
+                        or a dict mapping every state to its signal. A dict is resolved to an index table once
+                        and never called per round, so fixed lookups (like an if/elif chain over states) are
+                        much faster written as dicts. If None, uses a random signal from a predefined set.
         listener_strategy: A function that takes the received signal, the history of signals and actions, and the round number,
-                        and returns an action (string). If None, uses a simple mapping and defaults.
+                        and returns an action (string), or a dict mapping signals to actions. If None, the
+                        listener repeats its previous action for a known signal and picks a random action for
+                        a new one; a dict listener behaves the same for signals it does not contain.
+        seed: Optional seed for the simulation's random draws (randomness inside custom strategies is not covered).
+              The same seed gives the same rounds whether or not a sink is used.
+        sink: Optional writable text file. If given, rounds are simulated in chunks and written to it as one
+              JSON object per line instead of being kept in memory; see analyze_stream.
 
     Returns:
-        A list of dictionaries, where each dictionary represents a communication round
-        and contains the state, signal, action, and whether the action was correct.
+        A SiftHistory holding the per-round state, signal, action and correctness as parallel arrays.
+        Iterating it yields one dictionary per communication round.
+        If sink is given, a dictionary with num_rounds and correct_count instead.
     """
 
+    rng = np.random.default_rng(seed)
+
+    # With both default strategies the simulation has a closed form, so skip the general setup entirely.
+    if speaker_strategy is None and listener_strategy is None:
+        # Without rounds no action is ever taken, so action_space may be empty; skip the draw then.
+        if num_rounds:
+            first_action = rng.integers(0, len(action_space), size=len(state_space), dtype=np.int32)
+        else:
+            first_action = np.empty(0, dtype=np.int32)
+
+        def run_default_rounds(first_round, count):
+            return _fast_default_simulation(count, state_space, action_space, first_action, rng)
+
+        return _run_rounds(run_default_rounds, num_rounds, sink)
+
+    # States and the default listener's exploration actions are drawn from separate streams, so streaming
+    # in chunks consumes each stream in the same order as a single in-memory pass.
+    state_rng, action_rng = rng.spawn(2)
+
     # 1. Generate a set of unique signals.
     num_signals = len(state_space)
     signals = [f"signal_{i}" for i in range(num_signals)]  # Ensure unique signals
@@ -26,112 +272,190 @@ def create_sift_simulation(num_rounds, state_space, action_space, speaker_strate
     state_signal_mapping = dict(zip(state_space, signals))
     signal_action_mapping = dict(zip(signals, action_space)) #default mapping
 
-    # 3. Initialize memory for the listener to track signal-action history.
+    # 3. Initialize memory for a function listener to track signal-action history.
+    #    The default listener keeps its own per-signal array for _sim_kernel.
     listener_memory = {}  # Maps signals to actions taken
 
-    # 4. Define default speaker and listener strategies
-    def default_speaker_strategy(state, round_number):
-        """
-        Simple speaker strategy:  Always use the same signal for a given state.
-        """
-        return state_signal_mapping[state]
-
-    def default_listener_strategy(signal, history, round_number):
+    # 4. Use default strategies if none are provided.
+    #    The default speaker always uses the same signal for a given state (the default listener is _sim_kernel).
+    if speaker_strategy is None:
+        speaker_strategy = state_signal_mapping
+
+    # 5. Run the simulation for the specified number of rounds, recording indices into the string tables.
+    #    Custom strategies may produce signals or actions outside the defaults, so those tables can grow.
+    signal_table = list(signals)
+    signal_to_idx = {signal: i for i, signal in enumerate(signal_table)}
+    action_table = list(action_space)
+    action_to_idx = {action: i for i, action in enumerate(action_table)}
+    # Correct action index for each default signal index (signal i maps to action i).
+    sig2act = np.fromiter(
+        (action_to_idx[action] for action in signal_action_mapping.values()),
+        dtype=np.int32,
+        count=len(signal_action_mapping),
+    )
+    # Dict strategies are resolved to index tables once, instead of being called every round.
+    speaker_table = None
+    if isinstance(speaker_strategy, Mapping):
+        signal_for_state = speaker_strategy
+        speaker_table = np.array(
+            [_intern(signal_for_state[state], signal_table, signal_to_idx) for state in state_space], dtype=np.int32
+        )
+
+        def speaker_strategy(state, round_number):
+            return signal_for_state[state]
+
+    # A dict listener is the default listener with its memory pre-filled from the dict.
+    listener_table = {}
+    if isinstance(listener_strategy, Mapping):
+        for signal, action in listener_strategy.items():
+            listener_table[_intern(signal, signal_table, signal_to_idx)] = _intern(action, action_table, action_to_idx)
+        listener_strategy = None
+    kernel_memory = np.full(len(signal_table), -1, dtype=np.int32)  # The default listener's memory, grown with signal_table
+    for signal_index, action_index in listener_table.items():
+        kernel_memory[signal_index] = action_index
+
+    def run_rounds(first_round, count):
         """
-        Simple listener strategy:
-        - If the signal is seen before, repeat the previous action.
-        - If the signal is new, choose an action randomly.
+        Simulates count rounds starting at round number first_round. Tables and listener memory carry over
+        between calls.
         """
-        if signal in history:
-            return history[signal]
-        else:
-            # Exploration strategy:  Slightly less random than uniform.
-            available_actions = list(action_space)
-            if available_actions:
-                chosen_action = random.choice(available_actions)
-                return chosen_action
+        nonlocal kernel_memory
+        # All randomness is drawn up front: one state per round, plus the default listener's exploration choice.
+        state_idx = state_rng.integers(0, len(state_space), size=count, dtype=np.int32)
+        signal_idx = np.empty(count, dtype=np.int32)
+
+        if listener_strategy is None:
+            # The default listener never influences the speaker, so every signal is generated first and
+            # the listener then runs as one kernel pass over the signal indices.
+            action_draws = action_rng.integers(0, len(action_space), size=count, dtype=np.int32)
+            if speaker_table is not None:
+                signal_idx = speaker_table[state_idx]
             else:
-                return random.choice(action_space) # Fallback
+                for round_number, state_index in enumerate(state_idx.tolist(), start=first_round):
+                    signal = speaker_strategy(state_space[state_index], round_number)
+                    signal_idx[round_number - first_round] = _intern(signal, signal_table, signal_to_idx)
+            if len(signal_table) > len(kernel_memory):
+                new_signals = np.full(len(signal_table) - len(kernel_memory), -1, dtype=np.int32)
+                kernel_memory = np.concatenate((kernel_memory, new_signals))
+            action_idx = _run_sim_kernel(signal_idx, kernel_memory, action_draws)
+        else:
+            action_idx = np.empty(count, dtype=np.int32)
+            for round_number, state_index in enumerate(state_idx.tolist(), start=first_round):
+                # a. Speaker observes a random state.
+                state = state_space[state_index]
 
-    # 5.  Use default strategies if none are provided.
-    if speaker_strategy is None:
-        speaker_strategy = default_speaker_strategy
-    if listener_strategy is None:
-        listener_strategy = default_listener_strategy
-
-    # 6. Run the simulation for the specified number of rounds.
-    communication_history = []
-    for round_number in range(1, num_rounds + 1):
-        # a. Speaker observes a random state.
-        state = random.choice(state_space)
-
-        # b. Speaker generates a signal based on its strategy.
-        signal = speaker_strategy(state, round_number)
-
-        # c. Listener receives the signal and chooses an action.
-        action = listener_strategy(signal, listener_memory, round_number)
-
-        # d. Determine if the action was correct.
-        correct_action = signal_action_mapping.get(signal)  # Use the mapping.
-        is_correct = action == correct_action
-
-        # e. Store the signal and action in the listener's memory.
-        listener_memory[signal] = action
-
-        # f. Record the communication round.
-        communication_history.append({
-            "round": round_number,
-            "state": state,
-            "signal": signal,
-            "action": action,
-            "is_correct": is_correct,
-        })
-    return communication_history
+                # b. Speaker generates a signal based on its strategy; from here on it is handled by index.
+                signal = speaker_strategy(state, round_number)
+                signal_index = _intern(signal, signal_table, signal_to_idx)
+
+                # c. Listener receives the signal and chooses an action.
+                action = listener_strategy(signal, listener_memory, round_number)
+
+                # d. Store the signal and action in the listener's memory.
+                listener_memory[signal] = action
+
+                # e. Record the communication round.
+                signal_idx[round_number - first_round] = signal_index
+                action_idx[round_number - first_round] = _intern(action, action_table, action_to_idx)
+
+        # 6. Determine which actions were correct in one comparison over these rounds.
+        #    Signals outside the default mapping have no correct action.
+        correct_action_idx = np.full(len(signal_table), -1, dtype=np.int32)
+        correct_action_idx[:len(sig2act)] = sig2act
+        is_correct = action_idx == correct_action_idx[signal_idx]
+        return SiftHistory(state_idx, signal_idx, action_idx, is_correct, list(state_space), signal_table, action_table)
+
+    return _run_rounds(run_rounds, num_rounds, sink)
+
+def _run_rounds(run_rounds, num_rounds, sink):
+    """
+    Runs a simulation through run_rounds(first_round, count), which returns a SiftHistory for those rounds.
+
+    Without a sink all rounds are simulated at once and the SiftHistory is returned. With a sink they are
+    simulated STREAM_CHUNK_ROUNDS at a time and written as JSON lines, so memory use does not grow with
+    num_rounds, and a summary dictionary is returned.
+    """
+    if sink is None:
+        return run_rounds(1, num_rounds)
+
+    correct_count = 0
+    for first_round in range(1, num_rounds + 1, STREAM_CHUNK_ROUNDS):
+        chunk = run_rounds(first_round, min(STREAM_CHUNK_ROUNDS, num_rounds + 1 - first_round))
+        for round_number, round_data in enumerate(chunk, start=first_round):
+            round_data["round"] = round_number
+            sink.write(json.dumps(round_data) + "\n")
+        correct_count += int(chunk.is_correct.sum())
+    return {"num_rounds": num_rounds, "correct_count": correct_count}
+
+def _analyze_records(history, state_space):
+    """
+    Computes the round count, correct count, signal consistency and signal ambiguity from an iterable of
+    per-round dictionaries. Only per-state and per-signal data is kept, so the rounds can be streamed.
+    """
+    # Count rounds and correct rounds, and collect the distinct (state, signal) pairs, in a single pass.
+    num_rounds = 0
+    correct_count = 0
+    pairs = set()
+    for round_data in history:
+        num_rounds += 1
+        correct_count += round_data["is_correct"]
+        pairs.add((round_data["state"], round_data["signal"]))
+
+    # A state is consistent if it was sent with exactly one signal (never observed counts as inconsistent),
+    # and a signal is ambiguous if it was sent for more than one state.
+    signals_per_state = Counter(map(itemgetter(0), pairs))
+    states_per_signal = Counter(map(itemgetter(1), pairs))
+    signal_consistency = LabeledFlags(
+        list(state_space), np.fromiter((signals_per_state[state] == 1 for state in state_space), dtype=bool)
+    )
+    signal_ambiguity = LabeledFlags(
+        list(states_per_signal), np.fromiter((count > 1 for count in states_per_signal.values()), dtype=bool)
+    )
+
+    return num_rounds, correct_count, signal_consistency, signal_ambiguity
+
+def _analyze_arrays(history):
+    """
+    Computes the round count, correct count, signal consistency and signal ambiguity from a SiftHistory.
+
+    Every distinct (state, signal) pair is found with a single np.unique over the index arrays. A state is
+    consistent if it was observed with exactly one signal, and a signal is ambiguous if it was sent for
+    more than one state.
+    """
+    num_states = len(history.state_space)
+    num_signals = len(history.signals)
+    correct_count = int(history.is_correct.sum())
+
+    pairs = np.unique(history.state_idx.astype(np.int64) * num_signals + history.signal_idx)
+    signals_per_state = np.bincount(pairs // num_signals, minlength=num_states)
+    states_per_signal = np.bincount(pairs % num_signals, minlength=num_signals)
+
+    sent_signals = np.flatnonzero(states_per_signal)
+    signal_consistency = LabeledFlags(list(history.state_space), signals_per_state == 1)
+    signal_ambiguity = LabeledFlags(
+        [history.signals[signal] for signal in sent_signals.tolist()], states_per_signal[sent_signals] > 1
+    )
+    return len(history), correct_count, signal_consistency, signal_ambiguity
 
 def analyze_results(history, state_space, action_space):
     """
     Analyzes the results of the SIFT simulation.
 
     Args:
-        history: The list of dictionaries returned by the run_sift_simulation function.
+        history: The SiftHistory returned by create_sift_simulation (or an iterable of per-round dictionaries).
         state_space:  list of possible states
         action_space: list of actions
 
     Returns:
-        A dictionary containing analysis of the simulation.
+        A dictionary containing analysis of the simulation. signal_consistency (per state) and
+        signal_ambiguity (per signal) are LabeledFlags; call as_dict() for plain dictionaries.
     """
-    num_rounds = len(history)
-    correct_count = sum(round_data["is_correct"] for round_data in history)
+    if isinstance(history, SiftHistory):
+        num_rounds, correct_count, signal_consistency, signal_ambiguity = _analyze_arrays(history)
+    else:
+        num_rounds, correct_count, signal_consistency, signal_ambiguity = _analyze_records(history, state_space)
     accuracy = correct_count / num_rounds if num_rounds > 0 else 0
 
-    # Check for signal consistency and ambiguity.
-    signal_consistency = {}
-    signal_ambiguity = {}
-    for state in state_space:
-        signal_consistency[state] = []
-    for round_data in history:
-        state = round_data["state"]
-        signal = round_data["signal"]
-        if state in signal_consistency:
-            signal_consistency[state].append(signal)
-
-    for state in signal_consistency:
-        signals_for_state = signal_consistency[state]
-        if signals_for_state:
-            first_signal = signals_for_state[0]
-            all_same = all(signal == first_signal for signal in signals_for_state)
-            signal_consistency[state] = all_same
-        else:
-            signal_consistency[state] = False
-
-    for signal in set(round_data["signal"] for round_data in history):
-        states_for_signal = []
-        for round_data in history:
-            if round_data["signal"] == signal:
-                states_for_signal.append(round_data["state"])
-        signal_ambiguity[signal] = len(set(states_for_signal)) > 1
-
-
     analysis = {
         "num_rounds": num_rounds,
         "correct_count": correct_count,
@@ -141,7 +465,23 @@ def analyze_results(history, state_space, action_space):
     }
     return analysis
 
-def run_and_analyze_sift(num_rounds, state_space, action_space, speaker_strategy=None, listener_strategy=None):
+def analyze_stream(path, state_space, action_space):
+    """
+    Analyzes a simulation that create_sift_simulation streamed to a file.
+
+    Args:
+        path: Path of the JSON-lines file written through the sink argument.
+        state_space:  list of possible states
+        action_space: list of actions
+
+    Returns:
+        The same analysis dictionary as analyze_results. The file is read in a single pass and
+        only per-state and per-signal data is kept in memory.
+    """
+    with open(path) as f:
+        return analyze_results(map(json.loads, f), state_space, action_space)
+
+def run_and_analyze_sift(num_rounds, state_space, action_space, speaker_strategy=None, listener_strategy=None, seed=None):
     """
     Runs the SIFT simulation and analyzes the results.
 
@@ -151,14 +491,41 @@ def run_and_analyze_sift(num_rounds, state_space, action_space, speaker_strategy
         action_space: A list of possible actions.
         speaker_strategy:  A function defining speaker behavior
         listener_strategy: A function defining listener behavior
+        seed: Optional seed for the simulation's random draws.
 
     Returns:
         A tuple containing the simulation history and the analysis.
     """
-    history = create_sift_simulation(num_rounds, state_space, action_space, speaker_strategy, listener_strategy)
+    history = create_sift_simulation(num_rounds, state_space, action_space, speaker_strategy, listener_strategy, seed)
     analysis = analyze_results(history, state_space, action_space)
     return history, analysis
 
+def _sift_worker(indexed_config):
+    """
+    Runs one sweep configuration in a worker process and tags the result with its position.
+    """
+    index, config = indexed_config
+    return index, run_and_analyze_sift(**config)
+
+def run_sift_sweep(configs, n_workers=None):
+    """
+    Runs independent SIFT simulations in parallel worker processes.
+
+    Args:
+        configs: A list of dictionaries of keyword arguments for run_and_analyze_sift
+                 (num_rounds, state_space, action_space, and optionally speaker_strategy,
+                 listener_strategy and seed). Strategies must be module-level functions so they can be pickled.
+        n_workers: The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        A list of (history, analysis) tuples, in the same order as configs.
+    """
+    results = [None] * len(configs)
+    with Pool(n_workers) as pool:
+        for index, result in pool.imap_unordered(_sift_worker, enumerate(configs)):
+            results[index] = result
+    return results
+
 if __name__ == "__main__":
     # 1. Define the state and action spaces.
     state_space = ["Red Circle", "Blue Square", "Green Triangle", "Yellow Star"]
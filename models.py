@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import openai
 import os
 import random
@@ -6,57 +8,125 @@ from demo import run_and_analyze_sift
 # Set your OpenAI API key
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
-def openai_speaker(state, round_number, model="gpt-3.5-turbo"):
-    """Speaker agent using OpenAI API to generate signals for states"""
-    prompt = f"""
+# Static parts of the prompts, built once at import; only the per-call values are concatenated in.
+_SPEAKER_PREFIX = """
     You are a speaker in a communication game. You need to create a signal that will help the listener choose the correct action.
     
-    Current state: {state}
-    Round number: {round_number}
+    Current state: """
+_SPEAKER_SUFFIX = """
     
     Generate a short, clear signal (1-3 words) that best represents this state.
     Response format: Just the signal text, nothing else.
     """
-    
-    response = openai.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=10,
-        temperature=0.3
-    )
-    
-    signal = response.choices[0].message.content.strip()
-    return signal
 
-def openai_listener(signal, history, round_number, action_space, model="gpt-3.5-turbo"):
-    """Listener agent using OpenAI API to interpret signals and select actions"""
-    # Format history for the prompt
-    history_text = ""
-    for sig, action in history.items():
-        history_text += f"Signal: '{sig}' → Action: '{action}'\n"
-    
-    prompt = f"""
+_LISTENER_PREFIX = """
     You are a listener in a communication game. Based on the signal you receive, choose the most appropriate action.
     
-    Received signal: "{signal}"
+    Received signal: \""""
+_LISTENER_ACTIONS = """"
     
     Available actions:
-    {', '.join(action_space)}
+    """
+_LISTENER_HISTORY = """
     
     Previous signal-action pairs:
-    {history_text if history else "None"}
+    """
+_LISTENER_SUFFIX = """
     
     Response format: Return exactly one of the available actions listed above, nothing else.
     """
+
+def _speaker_prompt(state):
+    """Builds the speaker prompt for a state"""
+    return _SPEAKER_PREFIX + state + _SPEAKER_SUFFIX
+
+def _speaker_request(state, model):
+    """Builds the chat completion arguments for a speaker request, shared by the sync and async clients"""
+    return dict(
+        model=model,
+        messages=[{"role": "user", "content": _speaker_prompt(state)}],
+        max_tokens=10,
+        temperature=0
+    )
+
+# Speaker signals by (state, model). The prompt only depends on those, so the sync and async speakers
+# share this cache for the lifetime of the process.
+_speaker_cache = {}
+
+def _speaker_completion(state, model):
+    """Requests a signal for a state, unless it is already in _speaker_cache"""
+    key = (state, model)
+    if key not in _speaker_cache:
+        response = openai.chat.completions.create(**_speaker_request(state, model))
+        _speaker_cache[key] = response.choices[0].message.content.strip()
+    
+    return _speaker_cache[key]
+
+def openai_speaker(state, round_number, model="gpt-3.5-turbo"):
+    """Speaker agent using OpenAI API to generate signals for states.
+
+    Signals are cached per (state, model) for the lifetime of the process, so each state costs a
+    single API call per process and later runs reuse the same signals. Call _speaker_cache.clear()
+    to query the model afresh.
+    """
+    return _speaker_completion(state, model)
+
+async def openai_speaker_async(state, client, model="gpt-3.5-turbo"):
+    """Speaker agent using an openai.AsyncOpenAI client, so requests for several states can run concurrently"""
+    response = await client.chat.completions.create(**_speaker_request(state, model))
+    
+    return response.choices[0].message.content.strip()
+
+async def fetch_speaker_signals(state_space, model="gpt-3.5-turbo", max_concurrency=10):
+    """Requests the speaker's signal for every state concurrently and returns a dict of state -> signal.
+
+    Only states missing from the shared speaker cache are requested, and their signals are added to it,
+    so openai_speaker and later calls reuse them. max_concurrency caps the number of requests in flight,
+    to stay within API rate limits.
+    """
+    missing = [state for state in dict.fromkeys(state_space) if (state, model) not in _speaker_cache]
+    if missing:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with openai.AsyncOpenAI() as client:
+            async def fetch(state):
+                async with semaphore:
+                    return await openai_speaker_async(state, client, model=model)
+            
+            signals = await asyncio.gather(*(fetch(state) for state in missing))
+        for state, signal in zip(missing, signals):
+            _speaker_cache[(state, model)] = signal
+    return {state: _speaker_cache[(state, model)] for state in state_space}
+
+@functools.lru_cache(maxsize=1024)
+def _listener_completion(signal, history_items, action_space, model):
+    """Requests an action for a signal. Cached on everything that goes into the prompt."""
+    # Format history for the prompt
+    history_text = "".join(f"Signal: '{sig}' → Action: '{action}'\n" for sig, action in history_items)
+    
+    prompt = "".join((
+        _LISTENER_PREFIX, signal,
+        _LISTENER_ACTIONS, ', '.join(action_space),
+        _LISTENER_HISTORY, history_text if history_items else "None",
+        _LISTENER_SUFFIX,
+    ))
     
     response = openai.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
         max_tokens=20,
-        temperature=0.2
+        temperature=0
     )
     
-    action = response.choices[0].message.content.strip()
+    return response.choices[0].message.content.strip()
+
+def openai_listener(signal, history, round_number, action_space, model="gpt-3.5-turbo"):
+    """Listener agent using OpenAI API to interpret signals and select actions.
+
+    Responses are cached per (signal, history, action space, model) for the lifetime of the
+    process, so repeated situations, including in later runs, do not trigger another API call.
+    """
+    action = _listener_completion(signal, tuple(history.items()), tuple(action_space), model)
     
     # Ensure the response is in the action space
     if action not in action_space:
@@ -64,15 +134,25 @@ def openai_listener(signal, history, round_number, action_space, model="gpt-3.5-
         
     return action
 
-def run_ai_agent_simulation(num_rounds=10, speaker_model="gpt-3.5-turbo", listener_model="gpt-3.5-turbo"):
-    """Run a simulation using OpenAI-powered agents"""
+async def run_ai_agent_simulation_async(num_rounds=10, speaker_model="gpt-3.5-turbo", listener_model="gpt-3.5-turbo"):
+    """Run a simulation using OpenAI-powered agents, from inside an already running event loop (e.g. Jupyter).
+
+    The simulation itself makes blocking listener calls round by round, so it runs in a worker thread
+    and the event loop stays responsive meanwhile.
+    """
     # Define state and action spaces
     state_space = ["Red Circle", "Blue Square", "Green Triangle", "Yellow Star"]
     action_space = ["Pick Top-Left", "Pick Top-Right", "Pick Bottom-Left", "Pick Bottom-Right"]
     
-    # Create the strategy functions with model specification
-    def speaker_strategy(state, round_number):
-        return openai_speaker(state, round_number, model=speaker_model)
+    # The speaker's signal depends only on the state, so all signals are requested concurrently up front
+    # and passed as a dict strategy; the simulation then makes no speaker calls per round. With fewer
+    # rounds than states some states are likely never drawn, so signals are requested as needed instead.
+    # The listener depends on its history, so it still runs round by round.
+    if num_rounds >= len(state_space):
+        speaker_strategy = await fetch_speaker_signals(state_space, model=speaker_model)
+    else:
+        def speaker_strategy(state, round_number):
+            return openai_speaker(state, round_number, model=speaker_model)
     
     def listener_strategy(signal, history, round_number):
         return openai_listener(signal, history, round_number, action_space, model=listener_model)
@@ -82,7 +162,8 @@ def run_ai_agent_simulation(num_rounds=10, speaker_model="gpt-3.5-turbo", listen
     print(f"Speaker model: {speaker_model}")
     print(f"Listener model: {listener_model}")
     
-    history, analysis = run_and_analyze_sift(
+    history, analysis = await asyncio.to_thread(
+        run_and_analyze_sift,
         num_rounds, state_space, action_space, 
         speaker_strategy=speaker_strategy, 
         listener_strategy=listener_strategy
@@ -90,6 +171,14 @@ def run_ai_agent_simulation(num_rounds=10, speaker_model="gpt-3.5-turbo", listen
     
     return history, analysis
 
+def run_ai_agent_simulation(num_rounds=10, speaker_model="gpt-3.5-turbo", listener_model="gpt-3.5-turbo"):
+    """Run a simulation using OpenAI-powered agents.
+
+    Starts its own event loop with asyncio.run, so it raises RuntimeError when called while a loop
+    is already running (e.g. in Jupyter); await run_ai_agent_simulation_async there instead.
+    """
+    return asyncio.run(run_ai_agent_simulation_async(num_rounds, speaker_model, listener_model))
+
 if __name__ == "__main__":
     # Check if API key is set
     if not os.getenv("OPENAI_API_KEY"):